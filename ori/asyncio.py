@@ -2,10 +2,33 @@
 import asyncio
 import typing
 
+#: Whether this Python version ships :func:`asyncio.eager_task_factory`.
+#: The eager task factory arrived in Python 3.12. On older versions we
+#: silently fall back to the default task factory.
+_HAS_EAGER_TASK_FACTORY = hasattr(asyncio, "eager_task_factory")
+
+
+async def _run_with_eager_tasks(awaitable: typing.Awaitable):
+    """Install the eager task factory on the running loop, then await."""
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    return await awaitable
+
+
+async def _run_awaitable(awaitable: typing.Awaitable):
+    """Await an awaitable that is not a coroutine.
+
+    :func:`asyncio.run` only accepts coroutines, but `sync` accepts any
+    awaitable--futures, objects with `__await__`--so we await those
+    inside a coroutine of our own.
+    """
+    return await awaitable
+
 
 def sync(
     awaitable: typing.Awaitable,
     event_loop: typing.Optional[asyncio.events.AbstractEventLoop] = None,
+    *,
+    eager: bool = True,
 ):
     """
     Run an awaitable synchronously. Good for calling asyncio code from sync Python.
@@ -31,9 +54,16 @@ def sync(
     Args:
         awaitable: This is a function declared with `async def` or another type
             of awaitable object in Python.
-        event_loop: An :mod:`asyncio` event loop. This defaults to `None`, in which
-            case this function will try to pull the running event loop.
-            If no event loop exists, this function will try to create one.
+        event_loop: An :mod:`asyncio` event loop. This defaults to `None`, in
+            which case this function runs the awaitable with
+            :func:`asyncio.run`, which creates a fresh event loop and
+            closes it when the awaitable completes.
+        eager: When this is `True` (the default), install
+            :func:`asyncio.eager_task_factory` on the event loop before
+            running, so that tasks which complete without suspending skip
+            a full scheduler round-trip. This has no effect on Python
+            versions older than 3.12, which do not have the eager
+            task factory.
 
     Returns:
         This returns the same value that `awaitable` would if you
@@ -43,6 +73,18 @@ def sync(
         TypeError: If `awaitable` is not actually an awaitable object,
             then we raise a TypeError.
     """
-    if not event_loop:
-        event_loop = asyncio.get_event_loop()
+    if not isinstance(awaitable, typing.Awaitable):
+        raise TypeError(
+            "You need to provide an awaitable object, such as a coroutine "
+            "returned by a function declared with `async def`."
+        )
+    if not (eager and _HAS_EAGER_TASK_FACTORY):
+        if event_loop is None:
+            if asyncio.iscoroutine(awaitable):
+                return asyncio.run(awaitable)
+            return asyncio.run(_run_awaitable(awaitable))
+        return event_loop.run_until_complete(awaitable)
+    if event_loop is None:
+        return asyncio.run(_run_with_eager_tasks(awaitable))
+    event_loop.set_task_factory(asyncio.eager_task_factory)
     return event_loop.run_until_complete(awaitable)
@@ -1,9 +1,84 @@
 """Utilities for concurrency of Python functions with multithreading or multiprocessing."""
+import asyncio
+import atexit
 import concurrent.futures
 import functools
+import os
+import threading
 import typing
 
-from ori.errors import OriValidationError
+from ori.errors import OriNoInteractiveProcessPools, OriValidationError
+
+
+def _available_cpu_count() -> int:
+    """Return the number of CPUs available to this process, or 1 if unknown.
+
+    Python 3.13 added :func:`os.process_cpu_count`, which respects CPU
+    affinity masks and cgroup limits. On older versions we fall back to
+    :func:`os.cpu_count`.
+    """
+    if hasattr(os, "process_cpu_count"):
+        count = os.process_cpu_count()  # pylint: disable=no-member
+    else:
+        count = os.cpu_count()
+    return count or 1
+
+#: A cache of executors shared by every function that we send to the
+#: background. Executors are keyed on ``(executor_class, max_workers)``
+#: so that repeated calls to :func:`run_in_background` reuse the same
+#: warm pool instead of starting a brand-new one (and its threads or
+#: processes) every time.
+_EXECUTOR_CACHE: typing.Dict[
+    typing.Tuple[type, typing.Optional[int]], concurrent.futures.Executor
+] = {}
+
+_EXECUTOR_CACHE_LOCK = threading.Lock()
+
+
+def _get_executor(
+    executor_class: type, max_workers: typing.Optional[int]
+) -> concurrent.futures.Executor:
+    """Return the shared executor for this class and worker count, creating it if needed."""
+    key = (executor_class, max_workers)
+    with _EXECUTOR_CACHE_LOCK:
+        executor = _EXECUTOR_CACHE.get(key)
+        if executor is None:
+            executor = executor_class(max_workers=max_workers)
+            _EXECUTOR_CACHE[key] = executor
+        return executor
+
+
+def _shutdown_all_executors():
+    """Shut down every cached executor, waiting for pending work to finish."""
+    with _EXECUTOR_CACHE_LOCK:
+        executors = list(_EXECUTOR_CACHE.values())
+        _EXECUTOR_CACHE.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+def _reset_executor_cache():
+    """Drop every cached executor without shutting it down.
+
+    This runs in a child process right after a fork. The child inherits
+    the cache dictionary, but the worker threads behind each executor
+    only exist in the parent, so submitting to an inherited executor
+    would deadlock. Clearing the cache lets the child lazily create
+    fresh executors of its own.
+
+    The cache lock is rebound to a fresh one for the same reason: if
+    another thread held it at the moment of the fork, the child inherits
+    it locked, with no thread left alive to ever release it.
+    """
+    global _EXECUTOR_CACHE_LOCK  # pylint: disable=global-statement
+    _EXECUTOR_CACHE_LOCK = threading.Lock()
+    _EXECUTOR_CACHE.clear()
+
+
+atexit.register(_shutdown_all_executors)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor_cache)
 
 
 def run_in_background(
@@ -11,6 +86,7 @@ def run_in_background(
     *,
     executor_class: type,
     max_workers: typing.Optional[int] = None,
+    awaitable: bool = False,
 ):
     """
     Runs the function in a background thread or process, depending on the
@@ -30,6 +106,11 @@ def run_in_background(
             threads or processes to run at once. If this is set to
             None, then the executor's default maximum number of workers
             are used.
+        awaitable: If this is `True` and the wrapper is called from inside
+            a running :mod:`asyncio` event loop, the wrapper returns an
+            :class:`asyncio.Future` bound to that loop, which you can
+            `await` directly. Outside of an event loop, the wrapper
+            falls back to returning a :class:`concurrent.futures.Future`.
 
     Returns:
         This function returns a wrapper of the `func` function that you passed.
@@ -47,10 +128,26 @@ def run_in_background(
         raise OriValidationError(
             "You need to provide a callable function as the first " "argument."
         )
-    executor = executor_class(max_workers=max_workers)
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        # The executor is looked up on every call, not at decoration
+        # time. A wrapper created before a fork would otherwise keep
+        # submitting into the parent's pool, whose worker threads do
+        # not exist in the child--the after-fork hook clears the cache,
+        # and this per-call lookup (one lock plus a dict hit) is what
+        # lets the child lazily build a fresh pool.
+        executor = _get_executor(executor_class, max_workers)
+        wrapper.executor = executor  # type: ignore
+        if awaitable:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return loop.run_in_executor(
+                    executor, functools.partial(func, *args, **kwargs)
+                )
         return executor.submit(func, *args, **kwargs)
 
     # mypy throws an error here because callable functions typically do not have
@@ -58,12 +155,17 @@ def run_in_background(
     # we should check in on later.
     # Read more at https://github.com/python/mypy/issues/2087
     # TODO: Fix this mypy type error.
-    wrapper.executor = executor  # type: ignore
+    # Warm the pool upfront so the first call does not pay the startup
+    # cost; each call refreshes the attribute with the executor it used.
+    wrapper.executor = _get_executor(executor_class, max_workers)  # type: ignore
     return wrapper
 
 
 def run_in_background_thread(
-    func: typing.Callable, *, max_workers: typing.Optional[int] = None,
+    func: typing.Callable,
+    *,
+    max_workers: typing.Optional[int] = None,
+    awaitable: bool = False,
 ):
     """
     Runs the function in a background thread.
@@ -72,8 +174,12 @@ def run_in_background_thread(
         func: The function to run in the background.
         max_workers: Specify this to set the maximum number of parallel
             threads or processes to run at once. If this is set to
-            None, then the executor's default maximum number of workers
-            are used.
+            None, then we use `min(32, cpus + 4)` workers--a pool sized
+            for IO-bound work that behaves the same on every Python
+            version.
+        awaitable: If this is `True` and the wrapper is called from inside
+            a running :mod:`asyncio` event loop, the wrapper returns an
+            :class:`asyncio.Future` that you can `await` directly.
 
     Returns:
         This function returns a wrapper of the `func` function that you passed.
@@ -87,15 +193,21 @@ def run_in_background_thread(
             a callable function.
 
     """
+    if max_workers is None:
+        max_workers = min(32, _available_cpu_count() + 4)
     return run_in_background(
         func=func,
         executor_class=concurrent.futures.ThreadPoolExecutor,
         max_workers=max_workers,
+        awaitable=awaitable,
     )
 
 
 def run_in_background_process(
-    func: typing.Callable, *, max_workers: typing.Optional[int] = None,
+    func: typing.Callable,
+    *,
+    max_workers: typing.Optional[int] = None,
+    awaitable: bool = False,
 ):
     """
     Runs the function in a background process.
@@ -104,8 +216,10 @@ def run_in_background_process(
         func: The function to run in the background.
         max_workers: Specify this to set the maximum number of parallel
             threads or processes to run at once. If this is set to
-            None, then the executor's default maximum number of workers
-            are used.
+            None, then we use one worker per CPU on your machine.
+        awaitable: If this is `True` and the wrapper is called from inside
+            a running :mod:`asyncio` event loop, the wrapper returns an
+            :class:`asyncio.Future` that you can `await` directly.
 
     Returns:
         This function returns a wrapper of the `func` function that you passed.
@@ -117,9 +231,25 @@ def run_in_background_process(
     Raises:
         OriValidationError: When you provide a value for `func` that is not
             a callable function.
+        OriNoInteractiveProcessPools: When you call this function from an
+            interactive Python prompt. Process pools only work with code
+            that is saved to a file and importable.
     """
+    import __main__ as calling_main  # type: ignore
+
+    if not hasattr(calling_main, "__file__"):
+        raise OriNoInteractiveProcessPools(
+            "It looks like you are using Ori from the Python interactive "
+            "prompt, as opposed to running Python code saved to a file. "
+            "The executor for background processes can only run with "
+            "importable Python code saved to file.\n"
+            "Save your code to a file and try again."
+        )
+    if max_workers is None:
+        max_workers = max(1, os.cpu_count() or 1)
     return run_in_background(
         func=func,
         executor_class=concurrent.futures.ProcessPoolExecutor,
         max_workers=max_workers,
+        awaitable=awaitable,
     )
@@ -40,12 +40,32 @@ to get an iterator of the final return value or
 """
 
 import concurrent.futures
+import dataclasses
+import functools
+import os
+import queue
+import sys
+import threading
 import typing
 
 from ori.errors import OriNoInteractiveProcessPools, OriValidationError
 
+#: Module-level bindings for the two standard executors, so that hot
+#: paths compare and construct with a single global lookup instead of
+#: an attribute lookup on `concurrent.futures` every call.
+_THREAD_POOL_EXECUTOR = concurrent.futures.ThreadPoolExecutor
+_PROCESS_POOL_EXECUTOR = concurrent.futures.ProcessPoolExecutor
 
-class _ChainElement(typing.NamedTuple):
+#: Keyword arguments for the `_ChainElement` dataclass decorator.
+#: `slots=True` gives direct attribute access with no per-instance
+#: dict, but it only exists on Python 3.10 and newer.
+_DATACLASS_KWARGS: typing.Dict[str, bool] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS["slots"] = True
+
+
+@dataclasses.dataclass(**_DATACLASS_KWARGS)
+class _ChainElement:
     """A single element in our PoolChain."""
 
     function: typing.Callable
@@ -53,6 +73,151 @@ class _ChainElement(typing.NamedTuple):
     max_workers: typing.Optional[int]
     timeout: typing.Optional[int]
     chunksize: int
+    initializer: typing.Optional[typing.Callable] = None
+    initargs: typing.Tuple[typing.Any, ...] = ()
+
+
+#: Executor classes that have already passed `add()`'s validation.
+#: The two standard library executors are known-good upfront; any
+#: custom class is validated once and then remembered here, so batch
+#: construction loops do not re-run the `isinstance`/`getattr` checks
+#: on every `.add*()` call.
+_VALIDATED_EXECUTOR_CLASSES: typing.Set[type] = {
+    _THREAD_POOL_EXECUTOR,
+    _PROCESS_POOL_EXECUTOR,
+}
+
+
+def _validate_executor_class(executor_class: type):
+    """Run the full validation for an executor class we have not seen before."""
+    if not isinstance(executor_class, type):
+        raise OriValidationError(
+            "For the `executor_class` argument, you should pass a Python "
+            "class. Did you pass a Python instance instead?"
+        )
+    if not getattr(executor_class, "map", False):
+        raise OriValidationError(
+            "Your `executor_class` needs to implement the `.map` "
+            "method. It looks like it does not."
+        )
+    _VALIDATED_EXECUTOR_CLASSES.add(executor_class)
+
+
+def _check_positive_int(name: str, value: typing.Optional[int]):
+    """Raise OriValidationError unless `value` is None or a positive integer."""
+    if value is None:
+        return
+    if not isinstance(value, int):
+        raise OriValidationError(f"The `{name}` argument should be an int or None.")
+    if value < 1:
+        raise OriValidationError(
+            f"The `{name}` argument should be None or an integer "
+            f"greater than 0. You passed {value}."
+        )
+
+
+#: Sentinel pushed onto a stage boundary queue when the feeder thread
+#: has submitted every input item.
+_QUEUE_END = object()
+
+
+def _apply_to_chunk(
+    function: typing.Callable, chunk: typing.List[typing.Any]
+) -> typing.List[typing.Any]:
+    """Apply the stage function to every item of a chunk inside the worker.
+
+    This is what lets the pipelined path honor `chunksize`: one pickle
+    and pipe round-trip carries a whole chunk of items instead of one.
+    """
+    return [function(item) for item in chunk]
+
+
+def _pipelined_stage(
+    executor: concurrent.futures.Executor,
+    element: _ChainElement,
+    iterable: typing.Iterable[typing.Any],
+):
+    """Run one stage with its own feeder thread, yielding results in order.
+
+    A feeder thread pulls items from the previous stage and submits them
+    to this stage's executor, pushing the resulting futures onto a
+    bounded queue. Because each boundary has its own thread, every stage
+    can keep its workers busy at the same time, instead of all stages
+    being driven one item at a time by the main thread's `next()` calls.
+    The bounded queue provides backpressure: the feeder blocks once
+    roughly two futures per worker are outstanding.
+
+    Process pool stages submit chunks of `element.chunksize` items per
+    future (promoted by :func:`_auto_chunksize` when possible), so the
+    pipeline pays the same per-chunk rather than per-item IPC cost as
+    `Executor.map`. Thread pool stages ignore `chunksize`, exactly as
+    :meth:`concurrent.futures.ThreadPoolExecutor.map` does.
+    """
+    workers = element.max_workers or (os.cpu_count() or 1)
+    future_queue: queue.Queue = queue.Queue(maxsize=2 * workers)
+    chunksize = 1
+    if element.executor_class is _PROCESS_POOL_EXECUTOR:
+        chunksize = _auto_chunksize(element, iterable) or element.chunksize
+
+    def feed():
+        try:
+            if chunksize > 1:
+                chunk: typing.List[typing.Any] = []
+                for item in iterable:
+                    chunk.append(item)
+                    if len(chunk) == chunksize:
+                        future_queue.put(
+                            executor.submit(_apply_to_chunk, element.function, chunk)
+                        )
+                        chunk = []
+                if chunk:
+                    future_queue.put(
+                        executor.submit(_apply_to_chunk, element.function, chunk)
+                    )
+            else:
+                for item in iterable:
+                    future_queue.put(executor.submit(element.function, item))
+        except BaseException as exc:  # pylint: disable=broad-except
+            future_queue.put(exc)
+        else:
+            future_queue.put(_QUEUE_END)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    while True:
+        entry = future_queue.get()
+        if entry is _QUEUE_END:
+            break
+        if isinstance(entry, BaseException):
+            raise entry
+        if chunksize > 1:
+            yield from entry.result(timeout=element.timeout)
+        else:
+            yield entry.result(timeout=element.timeout)
+
+
+def _auto_chunksize(
+    element: _ChainElement, iterable: typing.Iterable[typing.Any]
+) -> typing.Optional[int]:
+    """Pick a larger chunksize for process pool stages when we know better.
+
+    Sending one item at a time over interprocess communication is the
+    worst case for a process pool: every item pays a full pickle and
+    pipe round-trip. When the user left `chunksize` at its default of 1
+    and the iterable knows its own length, we divide the work into a
+    few chunks per worker instead.
+
+    Returns the promoted chunksize, or `None` to use the chunksize
+    that the user configured.
+    """
+    if (
+        element.executor_class is _PROCESS_POOL_EXECUTOR
+        and element.chunksize == 1
+        and hasattr(iterable, "__len__")
+    ):
+        workers = element.max_workers or os.cpu_count() or 1
+        return max(1, len(iterable) // workers // 4)
+    return None
 
 
 class PoolChain:
@@ -60,7 +225,139 @@ class PoolChain:
 
     def __init__(self):
         """Create a new poolchain."""
-        self.chain: typing.List[_ChainElement] = []
+        self.chain: typing.Sequence[_ChainElement] = []
+        self._executors: typing.List[concurrent.futures.Executor] = []
+        self._frozen_stages: typing.Optional[typing.Tuple[typing.Callable, ...]] = None
+
+    def _get_or_create_executor(self, position: int, element: _ChainElement):
+        """Return the executor for the chain element at `position`.
+
+        The executor is created on the first `execute_*()` call and then
+        reused for every subsequent call, so that we do not pay the cost
+        of starting new threads or processes every time the poolchain runs.
+        """
+        while len(self._executors) <= position:
+            self._executors.append(None)
+        executor = self._executors[position]
+        if executor is None:
+            if element.initializer is not None:
+                executor = element.executor_class(
+                    max_workers=element.max_workers,
+                    initializer=element.initializer,
+                    initargs=element.initargs,
+                )
+            else:
+                executor = element.executor_class(max_workers=element.max_workers)
+            self._executors[position] = executor
+        return executor
+
+    def close(self, *, cancel_futures: bool = False):
+        """Shut down every executor that this poolchain has created.
+
+        The chain itself stays usable: a later `execute_*()` call will
+        lazily create fresh executors, paying their startup cost again.
+        If you would rather have this called automatically, use the poolchain
+        as a context manager with the `with` statement.
+
+        Args:
+            cancel_futures: If this is `True`, work that the executors
+                have queued but not yet started is dropped instead of
+                run to completion. This makes `close()` return almost
+                immediately after you abandon an `execute_lazy` iterator
+                partway through, instead of blocking until every queued
+                item finishes. Requires Python 3.9 or newer; on older
+                versions the queued work still runs.
+        """
+        for executor in self._executors:
+            if executor is not None:
+                if cancel_futures and sys.version_info >= (3, 9):
+                    executor.shutdown(wait=True, cancel_futures=True)
+                else:
+                    executor.shutdown(wait=True)
+        self._executors = []
+        self._frozen_stages = None
+
+    def _freeze(self) -> typing.Tuple[typing.Callable, ...]:
+        """Bind each chain element to its executor's `map` method.
+
+        The first `execute_*()` call freezes the chain into a tuple of
+        pre-bound callables so that re-execution does not have to re-read
+        every element's fields and rebuild the `map(...)` keyword arguments
+        on each call.
+        """
+        if self._frozen_stages is None:
+            self._frozen_stages = tuple(
+                functools.partial(
+                    self._get_or_create_executor(position, element).map,
+                    element.function,
+                    timeout=element.timeout,
+                    chunksize=element.chunksize,
+                )
+                for position, element in enumerate(self.chain)
+            )
+        return self._frozen_stages
+
+    @classmethod
+    def build(cls, stages: typing.Iterable[typing.Sequence]):
+        """Create a poolchain from a complete description of its stages.
+
+        When you know the whole chain upfront, this classmethod builds
+        it in one pass and stores the stages as a tuple, which iterates
+        faster than a list and cannot grow accidentally.
+
+        The usage is as follows:
+
+        .. highlight:: python
+        .. code-block:: python
+
+            from ori.poolchain import PoolChain
+
+            chain = PoolChain.build([
+                (parse_line, "io"),
+                (crunch_numbers, "cpu", {"max_workers": 4}),
+                (format_result, "io"),
+            ])
+            results = chain.execute_eager(lines)
+
+        Args:
+            stages: An iterable of `(function, kind)` or
+                `(function, kind, kwargs)` tuples, where `kind` is either
+                `"io"` or `"cpu"` (see :meth:`PoolChain.add_auto`) and
+                `kwargs` is a dict of extra keyword arguments such as
+                `max_workers`, `timeout`, `chunksize`, `initializer`,
+                or `initargs`.
+
+        Returns:
+            A new PoolChain with every stage already added.
+
+        Raises:
+            OriValidationError: Thrown if a stage tuple has the wrong
+                shape, or if the usual `add()` validation fails.
+        """
+        pool_chain = cls()
+        for stage in stages:
+            if len(stage) == 2:
+                function, kind = stage
+                kwargs: typing.Dict[str, typing.Any] = {}
+            elif len(stage) == 3:
+                function, kind, kwargs = stage
+            else:
+                raise OriValidationError(
+                    "Each stage should be a (function, kind) or "
+                    "(function, kind, kwargs) tuple. "
+                    f"You passed a tuple of length {len(stage)}."
+                )
+            pool_chain.add_auto(function, kind=kind, **kwargs)
+        pool_chain.chain = tuple(pool_chain.chain)
+        return pool_chain
+
+    def __enter__(self):
+        """Enter a `with` block, returning the poolchain itself."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Leave a `with` block, shutting down the poolchain's executors."""
+        self.close()
 
     def add(
         self,
@@ -70,6 +367,8 @@ class PoolChain:
         max_workers: typing.Optional[int] = None,
         timeout: typing.Optional[int] = None,
         chunksize: int = 1,
+        initializer: typing.Optional[typing.Callable] = None,
+        initargs: typing.Tuple[typing.Any, ...] = (),
     ):
         """
         Add a new element to the poolchain.
@@ -96,6 +395,12 @@ class PoolChain:
                 element at a time (the default). Try setting chunksize to
                 a value greater than one to more efficiently use
                 interprocess communication.
+            initializer: An optional function that each worker runs once
+                when it starts, before processing any items. Use this for
+                expensive per-worker setup--loading a model, opening a
+                database connection--so the cost is paid once per worker
+                instead of once per item.
+            initargs: A tuple of arguments to pass to `initializer`.
 
         Returns:
             The PoolChain object itself, allowing you to chain subsequent
@@ -106,41 +411,33 @@ class PoolChain:
                 a real Executor, a non-integer for one of the integer fields,
                 etc.
         """
-        if not isinstance(executor_class, type):
-            raise OriValidationError(
-                "For the `executor_class` argument, you should pass a Python "
-                "class. Did you pass a Python instance instead?"
-            )
-        if not getattr(executor_class, "map", False):
-            raise OriValidationError(
-                "Your `executor_class` needs to implement the `.map` "
-                "method. It looks like it does not."
-            )
+        # The isinstance guard runs before the set lookup: an unhashable
+        # argument (say, a list) would otherwise raise a bare TypeError
+        # from `in` instead of the OriValidationError we promise.
+        if not (
+            isinstance(executor_class, type)
+            and executor_class in _VALIDATED_EXECUTOR_CLASSES
+        ):
+            _validate_executor_class(executor_class)
         if (
             function.__name__ == "<lambda>"
-            and executor_class == concurrent.futures.ProcessPoolExecutor
+            and executor_class is _PROCESS_POOL_EXECUTOR
         ):
             raise OriValidationError(
                 "You cannot use lambda functions with ProcessPoolExecutor. "
                 "Define a named function with the `def` keyword instead."
             )
-        if max_workers is not None:
-            if not isinstance(max_workers, int):
-                raise OriValidationError(
-                    "The `max_workers` argument should be an int or None."
-                )
-            if max_workers < 1:
-                raise OriValidationError(
-                    "You need to define one or more worker. "
-                    f"You defined {max_workers} workers."
-                )
-        if timeout is not None:
-            if not isinstance(timeout, int):
-                raise OriValidationError("Timeout should be None or an integer.")
-            if timeout < 1:
-                raise OriValidationError(
-                    "Timeout should be None or an integer greater than 0."
-                )
+        _check_positive_int("max_workers", max_workers)
+        _check_positive_int("timeout", timeout)
+        if initializer is not None and not callable(initializer):
+            raise OriValidationError(
+                "The `initializer` argument should be a callable function "
+                "or None."
+            )
+        if isinstance(self.chain, tuple):
+            # Chains made by `build()` are stored as a tuple. Adding
+            # another stage turns the chain back into a list.
+            self.chain = list(self.chain)
         self.chain.append(
             _ChainElement(
                 function=function,
@@ -148,8 +445,11 @@ class PoolChain:
                 max_workers=max_workers,
                 timeout=timeout,
                 chunksize=chunksize,
+                initializer=initializer,
+                initargs=tuple(initargs),
             )
         )
+        self._frozen_stages = None
         return self
 
     def add_threadpool(
@@ -158,6 +458,8 @@ class PoolChain:
         *,
         max_workers: typing.Optional[int] = None,
         timeout: typing.Optional[int] = None,
+        initializer: typing.Optional[typing.Callable] = None,
+        initargs: typing.Tuple[typing.Any, ...] = (),
     ):
         """Add a function to run with threadpool to the poolchain.
 
@@ -171,6 +473,9 @@ class PoolChain:
                 your machine. This is usually a sensible default.
             timeout: The amount of time (in seconds) to wait for a
                 :class:`concurrent.futures.Future` before throwing an error.
+            initializer: An optional function that each worker thread runs
+                once when it starts, before processing any items.
+            initargs: A tuple of arguments to pass to `initializer`.
 
         Returns:
             The PoolChain object itself, allowing you to chain subsequent
@@ -183,9 +488,11 @@ class PoolChain:
         """
         return self.add(
             function=function,
-            executor_class=concurrent.futures.ThreadPoolExecutor,
+            executor_class=_THREAD_POOL_EXECUTOR,
             max_workers=max_workers,
             timeout=timeout,
+            initializer=initializer,
+            initargs=initargs,
         )
 
     def add_processpool(
@@ -195,6 +502,8 @@ class PoolChain:
         max_workers: typing.Optional[int] = None,
         timeout: typing.Optional[int] = None,
         chunksize: int = 1,
+        initializer: typing.Optional[typing.Callable] = None,
+        initargs: typing.Tuple[typing.Any, ...] = (),
     ):
         """
         Add a function to run with a "process pool" to the poolchain.
@@ -218,6 +527,11 @@ class PoolChain:
                 element at a time (the default). Try setting chunksize to
                 a value greater than one to more efficiently use
                 interprocess communication.
+            initializer: An optional function that each worker process runs
+                once when it starts, before processing any items. Like the
+                stage function itself, it must be a named, importable
+                function so it can be pickled.
+            initargs: A tuple of arguments to pass to `initializer`.
 
         Returns:
             The PoolChain object itself, allowing you to chain subsequent
@@ -240,18 +554,107 @@ class PoolChain:
             )
         return self.add(
             function=function,
-            executor_class=concurrent.futures.ProcessPoolExecutor,
+            executor_class=_PROCESS_POOL_EXECUTOR,
             max_workers=max_workers,
             timeout=timeout,
             chunksize=chunksize,
+            initializer=initializer,
+            initargs=initargs,
         )
 
-    def execute_lazy(self, iterable: typing.Iterable[typing.Any]):
+    def add_auto(
+        self,
+        function: typing.Callable,
+        *,
+        kind: str = "io",
+        max_workers: typing.Optional[int] = None,
+        timeout: typing.Optional[int] = None,
+        chunksize: int = 1,
+        initializer: typing.Optional[typing.Callable] = None,
+        initargs: typing.Tuple[typing.Any, ...] = (),
+    ):
+        """
+        Add a function to the poolchain, picking the executor for you.
+
+        Threads are the right choice for IO-bound work, where the Global
+        Interpreter Lock is released while waiting on the network or disk.
+        CPU-bound work holds the GIL, so it needs a process pool to make
+        progress in parallel. Tell this method which kind of work your
+        function does and it routes to :meth:`PoolChain.add_threadpool`
+        or :meth:`PoolChain.add_processpool` accordingly.
+
+        Note that `kind="cpu"` uses a process pool, so the same rules
+        apply as for :meth:`PoolChain.add_processpool`: the function must
+        be a named function defined with the `def` keyword, not a `lambda`.
+
+        Args:
+            function: This is the function that you want to run at the
+                end of the current chain.
+            kind: Either `"io"` for IO-bound work (runs in a thread pool)
+                or `"cpu"` for CPU-bound work (runs in a process pool).
+            max_workers: The maximum number of workers that the
+                executor can start. If this is `None`, then the executor
+                picks a sensible default.
+            timeout: The amount of time (in seconds) to wait for a
+                :class:`concurrent.futures.Future` before throwing an error.
+            chunksize: The number of iterable elements to hand to a worker
+                at a time. This is only used for `kind="cpu"`, where Ori
+                will also pick a larger chunksize automatically if you
+                leave this at 1 and your iterable has a known length.
+            initializer: An optional function that each worker runs once
+                when it starts, before processing any items. For
+                `kind="cpu"` it must be a named, importable function so
+                it can be pickled.
+            initargs: A tuple of arguments to pass to `initializer`.
+
+        Returns:
+            The PoolChain object itself, allowing you to chain subsequent
+            `add_*()` calls and at the end an `execute_*()` call.
+
+        Raises:
+            OriValidationError: Thrown if `kind` is not `"io"` or `"cpu"`,
+                or if the usual `add()` validation fails.
+        """
+        if kind == "io":
+            return self.add_threadpool(
+                function=function,
+                max_workers=max_workers,
+                timeout=timeout,
+                initializer=initializer,
+                initargs=initargs,
+            )
+        if kind == "cpu":
+            return self.add_processpool(
+                function=function,
+                max_workers=max_workers,
+                timeout=timeout,
+                chunksize=chunksize,
+                initializer=initializer,
+                initargs=initargs,
+            )
+        raise OriValidationError(
+            'The `kind` argument should be either "io" or "cpu". '
+            f"You passed {kind!r}."
+        )
+
+    def execute_lazy(
+        self, iterable: typing.Iterable[typing.Any], *, ordered: bool = True,
+    ):
         """Process the given iterable through the poolchain.
 
         When you call this function, the poolchain begins executing
         immediately
 
+        Args:
+            iterable: This is an iterable where every element in the
+                iterable is processed through the chain.
+            ordered: When this is `True` (the default), results come out
+                in the same order as their inputs, which means a slow
+                item holds back every item behind it. Pass `False` to
+                receive each result as soon as it is ready, in whatever
+                order the items finish. Unordered execution ignores
+                each stage's `chunksize`.
+
         Returns:
             This function returns an iterator that lazily executes
             the poolchain.
@@ -259,21 +662,110 @@ class PoolChain:
         if len(self.chain) < 1:
             raise OriValidationError("Try adding some workers first.")
 
+        stages = self._freeze()
+        if not ordered:
+            return self._execute_lazy_unordered(iterable)
+        if len(stages) == 1:
+            # With a single stage there is nothing to pipeline, so we
+            # return the executor's own map iterator directly instead of
+            # paying for an extra generator frame per item.
+            return self._run_stage(0, iterable)
+        return self._execute_lazy_chained(iterable)
+
+    def _execute_lazy_unordered(self, iterable: typing.Iterable[typing.Any]):
+        """Pipeline the iterable through every stage, yielding as items finish.
+
+        Each stage submits its inputs as they arrive from the previous
+        stage and hands results onward through
+        :func:`concurrent.futures.as_completed`, so a slow item never
+        blocks the items that finished after it.
+        """
         current_iterable = iterable
-        executors = []
-        for element in self.chain:
-            current_executor = element.executor_class(max_workers=element.max_workers,)
-            executors.append(current_executor)
-            current_iterable = current_executor.map(
-                element.function,
-                current_iterable,
-                timeout=element.timeout,
-                chunksize=element.chunksize,
+        for position, element in enumerate(self.chain):
+            executor = self._get_or_create_executor(position, element)
+            current_iterable = self._unordered_stage(
+                executor, element, current_iterable
             )
-        for item in current_iterable:
-            yield item
-        for executor in executors:
-            executor.shutdown(wait=True)
+        yield from current_iterable
+
+    @staticmethod
+    def _unordered_stage(
+        executor: concurrent.futures.Executor,
+        element: _ChainElement,
+        iterable: typing.Iterable[typing.Any],
+    ):
+        """Run one stage over the iterable, yielding results as they complete.
+
+        As in :func:`_pipelined_stage`, a feeder thread submits items
+        as they arrive from the previous stage, so this stage starts
+        working--and yielding--before the previous stage has finished.
+        Completed futures are handed to the consumer through a queue by
+        their done callbacks, in the order they finish. A semaphore
+        keeps roughly two futures per worker outstanding, which bounds
+        memory on long iterables the same way the ordered path's
+        bounded queue does.
+        """
+        workers = element.max_workers or (os.cpu_count() or 1)
+        backpressure = threading.Semaphore(2 * workers)
+        result_queue: queue.Queue = queue.Queue()
+
+        def feed():
+            submitted = 0
+            try:
+                for item in iterable:
+                    backpressure.acquire()
+                    future = executor.submit(element.function, item)
+                    future.add_done_callback(result_queue.put)
+                    submitted += 1
+            except BaseException as exc:  # pylint: disable=broad-except
+                result_queue.put(exc)
+            else:
+                # The consumer cannot stop at a plain sentinel, because
+                # done callbacks for still-running futures arrive after
+                # the feeder finishes. Tell it how many to expect.
+                result_queue.put((_QUEUE_END, submitted))
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        total: typing.Optional[int] = None
+        received = 0
+        while total is None or received < total:
+            try:
+                entry = result_queue.get(timeout=element.timeout)
+            except queue.Empty:
+                raise concurrent.futures.TimeoutError(
+                    f"No result arrived within {element.timeout} seconds."
+                ) from None
+            if isinstance(entry, BaseException):
+                raise entry
+            if isinstance(entry, tuple):
+                total = entry[1]
+                continue
+            received += 1
+            backpressure.release()
+            yield entry.result()
+
+    def _run_stage(self, position: int, iterable: typing.Iterable[typing.Any]):
+        """Run one frozen stage over the iterable, promoting chunksize if we can."""
+        stage = self._frozen_stages[position]
+        chunksize = _auto_chunksize(self.chain[position], iterable)
+        if chunksize is not None:
+            return stage(iterable, chunksize=chunksize)
+        return stage(iterable)
+
+    def _execute_lazy_chained(self, iterable: typing.Iterable[typing.Any]):
+        """Pipeline the iterable through every stage, yielding final results.
+
+        Every stage boundary gets its own feeder thread and bounded
+        queue (see :func:`_pipelined_stage`), so the stages execute as a
+        true pipeline rather than being serialized behind the consumer's
+        `next()` calls.
+        """
+        current_iterable = iterable
+        for position, element in enumerate(self.chain):
+            executor = self._get_or_create_executor(position, element)
+            current_iterable = _pipelined_stage(executor, element, current_iterable)
+        yield from current_iterable
 
     def execute_eager(self, iterable: typing.Iterable[typing.Any]):
         """
@@ -342,4 +834,10 @@ class PoolChain:
             value of every element in the list.
 
         """
-        return list(self.execute_lazy_single_threaded(iterable))
+        # Composing the stages with the builtin `map` keeps the whole
+        # per-item loop inside C, instead of routing every item through
+        # the Python generator frame of `execute_lazy_single_threaded`.
+        current_iterable = iter(iterable)
+        for element in self.chain:
+            current_iterable = map(element.function, current_iterable)
+        return list(current_iterable)
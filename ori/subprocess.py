@@ -1,11 +1,45 @@
 """Utility function for running external commands as subprocesses."""
-import multiprocessing
+import atexit
 import os
-import selectors
+import select
 import signal
 import subprocess
 import sys
+import threading
 import typing
+import weakref
+
+#: Whether this platform has epoll. Linux does; macOS and Windows do not,
+#: and there we fall back to :mod:`selectors`.
+_HAS_EPOLL = hasattr(select, "epoll")
+
+#: The signals that should stop a background command. SIGHUP does not
+#: exist on Windows, so we filter it out at import time.
+_SIGNALS = tuple(
+    sig
+    for sig in (getattr(signal, "SIGHUP", None), signal.SIGTERM, signal.SIGINT)
+    if sig is not None
+)
+
+#: Every command process that is still being managed by this module.
+#: The set holds weak references, so a process that has been cleaned up
+#: normally just disappears from it.
+_LIVE_PROCESSES: "weakref.WeakSet[subprocess.Popen]" = weakref.WeakSet()
+
+
+def _terminate_live_processes():
+    """Terminate any background command that is still running at exit.
+
+    Signal handlers cannot be installed from background threads, so
+    this atexit hook is what guarantees that commands do not outlive
+    the interpreter when the process shuts down normally.
+    """
+    for command_process in list(_LIVE_PROCESSES):
+        if command_process.poll() is None:
+            command_process.terminate()
+
+
+atexit.register(_terminate_live_processes)
 
 
 def _null_function(*args, **kwargs):  # pylint: disable=unused-argument
@@ -16,24 +50,244 @@ def _null_function(*args, **kwargs):  # pylint: disable=unused-argument
     """
 
 
+class _BackgroundProcess:
+    """A handle for a command running in the background.
+
+    This wraps the underlying :class:`subprocess.Popen` object and the
+    thread that reads its output, exposing the same `join()`,
+    `terminate()`, and `is_alive()` methods that the
+    :class:`multiprocessing.Process` returned by earlier versions of
+    this module had.
+    """
+
+    def __init__(
+        self,
+        command_process: subprocess.Popen,
+        reader_thread: typing.Optional[threading.Thread] = None,
+    ):
+        self.command_process = command_process
+        self.reader_thread = reader_thread
+
+    def join(self, timeout: typing.Optional[float] = None):
+        """Wait until the command exits and all of its output has been read."""
+        if self.reader_thread is not None:
+            self.reader_thread.join(timeout)
+            if self.reader_thread.is_alive():
+                return
+        try:
+            self.command_process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def terminate(self):
+        """Ask the command to stop by sending it SIGTERM."""
+        self.command_process.terminate()
+
+    def is_alive(self) -> bool:
+        """Return whether the command is still running."""
+        return self.command_process.poll() is None
+
+    @property
+    def pid(self) -> int:
+        """The process ID of the command."""
+        return self.command_process.pid
+
+    @property
+    def exitcode(self) -> typing.Optional[int]:
+        """The command's exit code, or `None` if it has not exited yet."""
+        return self.command_process.returncode
+
+
+#: How many bytes to ask the kernel for on each read from a pipe.
+_READ_SIZE = 65536
+
+#: Whether this Python has :func:`os.readinto` (new in Python 3.13),
+#: which reads into a caller-supplied buffer instead of allocating a
+#: fresh bytes object per read.
+_HAS_READINTO = hasattr(os, "readinto")
+
+
+def _send_complete_lines(
+    buffer: bytearray, callback: typing.Callable, binary: bool = False,
+):
+    """Dispatch the complete lines accumulated in a stream's buffer.
+
+    The user's callback only ever sees input that ends on a line
+    boundary, decoded in one batch, and is invoked at most once per
+    wake of the read loop no matter how many chunks that wake drained.
+    With `binary=True` the decode is skipped and the callback receives
+    raw bytes.
+    """
+    newline = buffer.rfind(b"\n")
+    if newline >= 0:
+        complete = bytes(buffer[: newline + 1])
+        del buffer[: newline + 1]
+        callback(complete if binary else complete.decode("utf-8", "replace"))
+
+
+def _send_remainder(
+    buffer: bytearray, callback: typing.Callable, binary: bool = False,
+):
+    """Dispatch whatever is left in a stream's buffer after EOF."""
+    if buffer:
+        remainder = bytes(buffer)
+        callback(remainder if binary else remainder.decode("utf-8", "replace"))
+        buffer.clear()
+
+
+def _pump(
+    command_process: subprocess.Popen,
+    stdout_function: typing.Callable,
+    stderr_function: typing.Callable,
+    binary: bool = False,
+):
+    """Dispatch the command's output to the user's functions until EOF.
+
+    This is the reader loop on its own, with no signal or exception
+    handling, so it can be driven by any thread the caller owns.
+    """
+    # Listen on stdout and stderr in parallel, preserving order,
+    # writing stdout to debug logs and stderr to info logs. When the
+    # two streams were merged at Popen time, there is no stderr pipe
+    # at all and only stdout is watched.
+    has_stderr = command_process.stderr is not None
+    stdout_buffer = bytearray()
+    stderr_buffer = bytearray()
+    if _HAS_EPOLL:
+        # Register the two pipe file descriptors with epoll directly.
+        # selectors.DefaultSelector builds a SelectorKey namedtuple
+        # and translates event masks on every wake, which adds up for
+        # chatty subprocesses; the raw epoll loop skips both.
+        stdout_fd = command_process.stdout.fileno()
+        stderr_fd = command_process.stderr.fileno() if has_stderr else -1
+        if _HAS_READINTO:
+            # One buffer is reused for every read; only the complete
+            # lines copied out by _send_complete_lines are allocated.
+            read_view = memoryview(bytearray(_READ_SIZE))
+
+            def read_chunk(fd):
+                """Read into the shared buffer, returning a view of the bytes."""
+                num_read = os.readinto(fd, read_view)  # pylint: disable=no-member
+                return read_view[:num_read]
+
+        else:
+
+            def read_chunk(fd):
+                """Read up to _READ_SIZE freshly-allocated bytes."""
+                return os.read(fd, _READ_SIZE)
+
+        # With the pipes in non-blocking mode, one epoll wake can
+        # drain everything the subprocess has produced so far,
+        # instead of paying one epoll_wait syscall per chunk.
+        os.set_blocking(stdout_fd, False)
+        if has_stderr:
+            os.set_blocking(stderr_fd, False)
+        epoll = select.epoll()
+        try:
+            epoll.register(stdout_fd, select.EPOLLIN)
+            if has_stderr:
+                epoll.register(stderr_fd, select.EPOLLIN)
+            # Bind the names used on every iteration to locals:
+            # LOAD_FAST is considerably cheaper than the attribute
+            # and global lookups it replaces.
+            poll = epoll.poll
+            send_complete_lines = _send_complete_lines
+            open_streams = 2 if has_stderr else 1
+            while True:
+                # Drain every ready stream before dispatching anything,
+                # then invoke each callback at most once per wake with
+                # everything that wake produced. A logging callback
+                # then takes its handler lock once per wake instead of
+                # once per chunk.
+                for fd, _ in poll():
+                    is_stdout = fd == stdout_fd
+                    stream_buffer = stdout_buffer if is_stdout else stderr_buffer
+                    while True:
+                        try:
+                            chunk = read_chunk(fd)
+                        except BlockingIOError:
+                            break
+                        if not chunk:
+                            # This stream hit EOF. Flush everything it
+                            # has buffered, including the partial last
+                            # line, and keep reading the other stream
+                            # until that one finishes too.
+                            epoll.unregister(fd)
+                            open_streams -= 1
+                            _send_remainder(
+                                stream_buffer,
+                                stdout_function if is_stdout else stderr_function,
+                                binary,
+                            )
+                            if open_streams == 0:
+                                return
+                            break
+                        stream_buffer += chunk
+                send_complete_lines(stdout_buffer, stdout_function, binary)
+                send_complete_lines(stderr_buffer, stderr_function, binary)
+        finally:
+            epoll.close()
+    else:
+        # Only the non-epoll fallback needs the selectors module, so
+        # Linux users never pay its import cost.
+        import selectors  # pylint: disable=import-outside-toplevel
+
+        stdout_fileobj = command_process.stdout
+        stdout_read = stdout_fileobj.read
+        stderr_read = command_process.stderr.read if has_stderr else None
+        sel = selectors.DefaultSelector()
+        sel.register(stdout_fileobj, selectors.EVENT_READ)
+        if has_stderr:
+            sel.register(command_process.stderr, selectors.EVENT_READ)
+        sel_select = sel.select
+        send_complete_lines = _send_complete_lines
+        open_streams = 2 if has_stderr else 1
+        while True:
+            # As in the epoll loop above: read every ready stream
+            # first, then dispatch to each callback at most once per
+            # wake.
+            for key, _ in sel_select():
+                is_stdout = key.fileobj is stdout_fileobj
+                chunk = (stdout_read if is_stdout else stderr_read)(_READ_SIZE)
+                if not chunk:
+                    # This stream hit EOF. Flush everything it has
+                    # buffered, including the partial last line, and
+                    # keep reading the other stream until that one
+                    # finishes too.
+                    sel.unregister(key.fileobj)
+                    open_streams -= 1
+                    _send_remainder(
+                        stdout_buffer if is_stdout else stderr_buffer,
+                        stdout_function if is_stdout else stderr_function,
+                        binary,
+                    )
+                    if open_streams == 0:
+                        return
+                    continue
+                if is_stdout:
+                    stdout_buffer += chunk
+                else:
+                    stderr_buffer += chunk
+            send_complete_lines(stdout_buffer, stdout_function, binary)
+            send_complete_lines(stderr_buffer, stderr_function, binary)
+
+
 def _target(
     *,
-    command: typing.Sequence[typing.Union[bytes, str, os.PathLike]],
+    command_process: subprocess.Popen,
     stdout_function: typing.Optional[typing.Callable] = None,
     stderr_function: typing.Optional[typing.Callable] = None,
     exception_function: typing.Optional[typing.Callable] = None,
     exit_code_on_killed: int = 0,
+    binary: bool = False,
 ):
-    """Manage the actual command we're running."""
+    """Read the command's output, dispatching it to the user's functions."""
     if not stdout_function:
         stdout_function = _null_function
     if not stderr_function:
         stderr_function = _null_function
     if not exception_function:
         exception_function = _null_function
-    command_process = subprocess.Popen(  # pylint: disable=consider-using-with
-        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True,
-    )
 
     def kill_handler(signum, frame):  # pylint: disable=unused-argument
         """
@@ -42,28 +296,35 @@ def _target(
         sys.exit(exit_code_on_killed)
 
     try:
-        signal.signal(signal.SIGHUP, kill_handler)
-        signal.signal(signal.SIGTERM, kill_handler)
-        signal.signal(signal.SIGINT, kill_handler)
+        # Signal handlers can only be installed on the main thread. The
+        # reader normally runs on a background thread, where we instead
+        # rely on the `except` clause below to stop the command process.
+        if threading.current_thread() is threading.main_thread():
+            for stop_signal in _SIGNALS:
+                signal.signal(stop_signal, kill_handler)
 
-        # Listen on stdout and stderr in parallel, preserving order,
-        # writing stdout to debug logs and stderr to info logs.
-        sel = selectors.DefaultSelector()
-        sel.register(command_process.stdout, selectors.EVENT_READ)
-        sel.register(command_process.stderr, selectors.EVENT_READ)
-        while True:
-            for key, _ in sel.select():
-                data = key.fileobj.read1().decode()
-                if not data:
-                    return
-                if key.fileobj is command_process.stdout:
-                    stdout_function(data)
-                else:
-                    stderr_function(data)
-    except BaseException as exc:
+        _pump(command_process, stdout_function, stderr_function, binary)
+    except (OSError, ValueError, RuntimeError) as exc:
+        # The errors that reading a pipe can realistically raise. These
+        # are reported to the user's exception function.
         exception_function(exc)
         command_process.terminate()
         raise
+    except BaseException:
+        # Everything else--KeyboardInterrupt, SystemExit from the kill
+        # handler--still stops the command, but is not something the
+        # user's exception function needs to hear about.
+        command_process.terminate()
+        raise
+    finally:
+        # Close the pipe file objects ourselves. Nothing else ever
+        # reads them after this, and leaving them to the garbage
+        # collector would hold their fds open indefinitely and emit
+        # ResourceWarnings.
+        if command_process.stdout is not None:
+            command_process.stdout.close()
+        if command_process.stderr is not None:
+            command_process.stderr.close()
 
 
 def run_process_in_background(
@@ -73,6 +334,7 @@ def run_process_in_background(
     stderr_function: typing.Optional[typing.Callable] = None,
     exception_function: typing.Optional[typing.Callable] = None,
     exit_code_on_killed: int = 0,
+    binary: bool = False,
 ):
     """
     Runs `command`, writing stdout and stderr to the logger in `logger`.
@@ -97,34 +359,103 @@ def run_process_in_background(
             while logging the program.
         exit_code_on_killed: This is the exit code we return for the subprocess
             when we catch an exception while logging the program.
+        binary: If this is `True`, `stdout_function` and `stderr_function`
+            receive raw :class:`bytes` instead of decoded :class:`str`
+            objects, and the UTF-8 decoding step is skipped entirely.
+            Use this when your functions write to a binary file or a
+            socket and do not need text.
 
     Returns:
-        This returns an already-started :class:`multiprocessing.Process` instance,
-        which you can use to monitor or kill the process as time goes on.
+        This returns a handle for the already-started command, which you
+        can use to monitor or kill the process as time goes on. The handle
+        has the `join()`, `terminate()`, and `is_alive()` methods that the
+        :class:`multiprocessing.Process` returned by earlier versions of
+        this function had.
 
     Warning:
         The parameters **stdout_function**, **stderr_function** and **exception_function**
         are used to log the standard output, standard error, and any exceptions that
-        your command might raise. These functions are run in a Python subprocess,
-        which means that they must be *importable* at the module level and
-        *pickleable*. Closures, which are functions enclosed in other functions,
-        are not pickleable.
+        your command might raise. These functions run on a background thread
+        inside your own process, so ordinary functions, closures, and bound
+        methods all work--but they should be thread-safe.
 
         If you feel like you need to add additional parameters or state to your
         logging functions, you can write your functions as instances of
         Python classes with the
         `__call__() magic method <https://www.geeksforgeeks.org/__call__-in-python/>`_.
+        If your function writes to a file, open the file once when you
+        create the function and keep it open, rather than reopening it
+        for every chunk of output--a chatty command can call your
+        function many times per second.
 
     """
-    control_process = multiprocessing.Process(
+    if (
+        stdout_function is None
+        and stderr_function is None
+        and exception_function is None
+    ):
+        # Fire and forget: with no callbacks there is nothing to read,
+        # so skip the pipes and the reader thread entirely and let the
+        # kernel discard the output.
+        # close_fds=True with an empty pass_fds: see the comment on
+        # the Popen call below.
+        command_process = subprocess.Popen(  # pylint: disable=consider-using-with
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            pass_fds=(),
+        )
+        _LIVE_PROCESSES.add(command_process)
+        return _BackgroundProcess(command_process)
+    # When both streams go to the same callable there is no reason to
+    # keep them apart: letting the kernel merge stderr into stdout
+    # halves the number of pipes, registrations, and wakes, and gives
+    # exact interleaving for free.
+    # Equality rather than identity: bound methods like `log.append`
+    # produce a fresh object on every attribute access, but compare
+    # equal when they wrap the same function and instance.
+    merge_streams = stdout_function is not None and stdout_function == stderr_function
+    # `bufsize=0` keeps stdout/stderr as raw, unbuffered pipe objects.
+    # The reader does its own buffering, so the BufferedReader that
+    # Popen would otherwise interpose is one extra copy for nothing.
+    # Neither Popen call passes preexec_fn, a custom executable, or
+    # start_new_session, which would each rule out CPython's
+    # posix_spawn path (vfork on glibc, which shares the parent's page
+    # tables instead of copying them -- a large saving when the parent
+    # has a big heap). Note that close_fds=True below rules it out
+    # anyway on every Python before 3.13, where posix_spawn gained
+    # closefrom file actions, so today these calls usually go through
+    # fork+exec; keeping the other keywords at their defaults is what
+    # lets newer interpreters take the fast path. Think twice before
+    # adding a Popen keyword here.
+    #
+    # close_fds=True with an explicitly empty pass_fds lets the child
+    # close its inherited descriptors with a single close_range()
+    # syscall on kernels that have it, instead of scanning fd numbers
+    # up to SC_OPEN_MAX between fork and exec. The fds this module
+    # opens (pipes, the epoll fd) are already non-inheritable per
+    # PEP 446, so nothing leaks either way.
+    command_process = subprocess.Popen(  # pylint: disable=consider-using-with
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if merge_streams else subprocess.PIPE,
+        close_fds=True,
+        pass_fds=(),
+        bufsize=0,
+    )
+    _LIVE_PROCESSES.add(command_process)
+    reader_thread = threading.Thread(
         target=_target,
         kwargs=dict(
-            command=command,
+            command_process=command_process,
             stdout_function=stdout_function,
             stderr_function=stderr_function,
             exception_function=exception_function,
             exit_code_on_killed=exit_code_on_killed,
+            binary=binary,
         ),
+        daemon=True,
     )
-    control_process.start()
-    return control_process
+    reader_thread.start()
+    return _BackgroundProcess(command_process, reader_thread)
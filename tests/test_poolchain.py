@@ -0,0 +1,36 @@
+"""Unit test module for :mod:`ori.poolchain`."""
+import time
+import unittest
+
+import ori.poolchain
+
+
+def sleep_for(seconds):
+    """Sleep for the given duration, then return it."""
+    time.sleep(seconds)
+    return seconds
+
+
+def identity(value):
+    """Return the value unchanged."""
+    return value
+
+
+class TestPoolChain(unittest.TestCase):
+    """Unit tests for ori.poolchain."""
+
+    def test__execute_lazy_unordered__no_stage_barrier(self):
+        """Test that a slow item does not hold back fast ones across stages."""
+        chain = (
+            ori.poolchain.PoolChain()
+            .add_threadpool(sleep_for, max_workers=4)
+            .add_threadpool(identity, max_workers=4)
+        )
+        with chain:
+            results = chain.execute_lazy([0.5, 0.02, 0.02, 0.02], ordered=False)
+            # With a barrier between stages, the first result would
+            # only arrive after the slow item finished.
+            first = next(results)
+            assert first == 0.02
+            remaining = sorted(results)
+        assert remaining == [0.02, 0.02, 0.5]
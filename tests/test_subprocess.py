@@ -1,21 +1,33 @@
 """Unit test module for :mod:`ori.subprocess`."""
 import os
+import sys
 import tempfile
 import unittest
 import uuid
+import weakref
 
 import ori.subprocess
 
 
 class LogToFile:
-    """Create a function that continually appends to a file."""
+    """Create a function that continually appends to a file.
+
+    The file is opened once, unbuffered, and kept open: reopening it on
+    every chunk of subprocess output would cost three syscalls plus an
+    io stack per call.
+    """
 
     def __init__(self, filename: str):
         self.filename = filename
+        self._handle = open(  # pylint: disable=consider-using-with
+            filename, "ab", buffering=0
+        )
+        weakref.finalize(self, self._handle.close)
 
     def __call__(self, message: str):
-        with open(self.filename, "a") as handle:
-            return handle.write(message)
+        return self._handle.write(
+            message.encode() if isinstance(message, str) else message
+        )
 
 
 class TestSubprocess(unittest.TestCase):
@@ -38,3 +50,61 @@ class TestSubprocess(unittest.TestCase):
             output = fh.read()
         temp_dir.cleanup()
         assert "test_subprocess.py" in output
+
+    def test__run_process_in_background__binary(self):
+        """Test that `binary=True` delivers raw bytes to the log function."""
+        received = []
+        process = ori.subprocess.run_process_in_background(
+            command=[sys.executable, "-c", "print('raw bytes line')"],
+            stdout_function=received.append,
+            binary=True,
+        )
+        process.join()
+        assert all(isinstance(chunk, bytes) for chunk in received)
+        assert b"raw bytes line" in b"".join(received)
+
+    def test__run_process_in_background__binary_log_to_file(self):
+        """Test that LogToFile accepts the bytes that `binary=True` produces."""
+        temp_dir = tempfile.TemporaryDirectory()
+        temp_filename = os.path.join(temp_dir.name, str(uuid.uuid4()) + ".txt")
+        log_to_file = LogToFile(temp_filename)
+        process = ori.subprocess.run_process_in_background(
+            command=[sys.executable, "-c", "print('binary to file')"],
+            stdout_function=log_to_file,
+            binary=True,
+        )
+        process.join()
+        with open(temp_filename, "rb") as fh:
+            output = fh.read()
+        temp_dir.cleanup()
+        assert b"binary to file" in output
+
+    def test__run_process_in_background__merged_streams(self):
+        """Test that one function for both streams receives stdout and stderr."""
+        temp_dir = tempfile.TemporaryDirectory()
+        temp_filename = os.path.join(temp_dir.name, str(uuid.uuid4()) + ".txt")
+        log_to_file = LogToFile(temp_filename)
+        process = ori.subprocess.run_process_in_background(
+            command=[
+                sys.executable,
+                "-c",
+                "import sys; print('to stdout'); print('to stderr', file=sys.stderr)",
+            ],
+            stdout_function=log_to_file,
+            stderr_function=log_to_file,
+        )
+        process.join()
+        with open(temp_filename, "r") as fh:
+            output = fh.read()
+        temp_dir.cleanup()
+        assert "to stdout" in output
+        assert "to stderr" in output
+
+    def test__run_process_in_background__fire_and_forget(self):
+        """Test that a command with no log functions runs to completion."""
+        process = ori.subprocess.run_process_in_background(
+            command=[sys.executable, "-c", "print('discarded')"],
+        )
+        process.join()
+        assert not process.is_alive()
+        assert process.exitcode == 0